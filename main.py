@@ -1,16 +1,52 @@
+import os
 import cv2
 import numpy as np
 import threading
 import time
 from datetime import datetime, timedelta
+from tkinter import TclError
 import customtkinter as ctk
 from PIL import Image, ImageTk
-import queue
+from collections import deque
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; fall back to plain Python functions
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 # Set appearance mode and color theme
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# YuNet face detection model (https://github.com/opencv/opencv_zoo)
+FACE_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "face_detection_yunet_2023mar.onnx")
+
+@njit(cache=True)
+def posture_score(size_ratio, chin_deviation, tilt, size_tol, position_tol, tilt_tol, min_mult, max_mult):
+    """Posture multiplier from baseline deviations"""
+    # Bonus for good posture
+    if size_ratio <= 1 + size_tol * 0.5 and chin_deviation <= position_tol * 0.5 and tilt <= tilt_tol * 0.5:
+        score = 1.2
+    else:
+        score = 1.0
+    
+    # Penalties for being too close, slouching (chin tuck) and tilting the head
+    score -= max(0.0, size_ratio - 1 - size_tol)
+    score -= max(0.0, chin_deviation - position_tol)
+    score -= max(0.0, tilt - tilt_tol)
+    return min(max_mult, max(min_mult, score))
+
+@njit(cache=True)
+def updated_focus_score(score, time_delta, present, posture_mult, points_per_second, decay_rate, max_score):
+    """Focus score after time_delta seconds of presence or absence"""
+    if present:
+        # Earn points for being present, modified by posture
+        return min(max_score, score + points_per_second * time_delta * posture_mult)
+    # Lose points when away
+    return max(0.0, score - decay_rate * time_delta)
+
 class GazeFocus:
     def __init__(self):
         # Core state
@@ -23,11 +59,13 @@ class GazeFocus:
         self.session_start_time = None
         self.session_active = False
         self.total_session_time = 0
-        self.last_update_time = time.time()
+        self.last_update_time = time.monotonic()
+        self.score_update_interval = 0.25      # Seconds between focus score updates
+        self._next_score_update = 0.0
         
         # Posture baseline (calibrated when first face detected)
-        self.baseline_face_size = None
-        self.baseline_face_center_y = None
+        self.baseline_eye_distance = None
+        self.baseline_chin_offset = None
         self.calibration_frames = 0
         self.calibration_complete = False
         
@@ -39,18 +77,53 @@ class GazeFocus:
         
         # Detection parameters
         self.face_size_tolerance = 0.4         # Threshold for "too close" detection
-        self.face_position_tolerance = 0.3     # Threshold for slouching detection
+        self.face_position_tolerance = 0.3     # Threshold for slouching (chin tuck) detection
+        self.head_tilt_tolerance = 0.26        # Sideways head tilt allowed, in radians (~15°)
         self.detection_smoothing = 3           # Frames to smooth detection
-        self.detection_buffer = []
+        self.detection_scale = 0.5             # Downsample factor before face detection
+        self.detection_interval = 5            # Run face detector every N frames
+        self.frame_idx = 0
+        self.last_face = None
+        self.last_landmarks = None
+        self.detection_buffer = deque(maxlen=self.detection_smoothing)
+        self.present_count = 0                 # Running sum of detection_buffer
+        self.debug_overlay = False             # Draw status text onto the video frame
+        self.motion_threshold = 2.0            # Mean pixel change below which a frame is skipped
+        self.prev_tiny = None                  # Tiny gray copy of the last processed frame
+        self.detector_ran = False              # Last processed frame ran the detector
         
         # Threading
-        self.frame_queue = queue.Queue(maxsize=2)
+        self.frame_deque = deque(maxlen=1)     # Latest preview frame; new frames evict old
+        self.frame_lock = threading.Lock()
+        self.frame_pending = False             # An apply_frame call is already scheduled
         self.running = True
         self.opencv_thread = None
         
+        # Last applied UI state, used to skip redundant widget reconfiguration
+        self._widget_state = {}
+        self._last_progress = None
+        
         # OpenCV setup
+        # YuNet DNN face detector (bounding box + 5 landmarks per face);
+        # loaded before opening the camera so a missing model doesn't leave it open
+        if not os.path.exists(FACE_MODEL_PATH):
+            raise FileNotFoundError(f"Face detection model not found: {FACE_MODEL_PATH}")
+        self.detector = cv2.FaceDetectorYN.create(FACE_MODEL_PATH, "", (320, 240), 0.7, 0.3, 5000)
+        
         self.cap = cv2.VideoCapture(0)
-        self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+        # Compressed 640x480 capture; single-frame buffer avoids stale frames
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        self.cap.set(cv2.CAP_PROP_FPS, 30)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        
+        # Preallocated per-frame buffers. Always use the array returned by the
+        # OpenCV call: if a size differs, the result lands in a new buffer.
+        self._small = cv2.UMat(240, 320, cv2.CV_8UC3)
+        self._preview = cv2.UMat(240, 320, cv2.CV_8UC3)
+        self._mirrored = cv2.UMat(240, 320, cv2.CV_8UC3)
+        self._preview_rgb = cv2.UMat(240, 320, cv2.CV_8UC3)
         
         # Setup UI
         self.setup_ui()
@@ -83,6 +156,9 @@ class GazeFocus:
         self.video_label = ctk.CTkLabel(self.video_frame, text="Camera Loading...", width=320, height=240)
         self.video_label.pack(expand=True)
         
+        # Persistent preview image, refreshed in place for every frame
+        self.video_photo = ImageTk.PhotoImage(Image.new("RGB", (320, 240)))
+        
         # Focus Score Section
         score_frame = ctk.CTkFrame(main_frame, corner_radius=15)
         score_frame.pack(fill="x", padx=40, pady=(0, 20))
@@ -196,121 +272,194 @@ class GazeFocus:
     
     def opencv_loop(self):
         """Main OpenCV processing loop (runs in separate thread)"""
+        # cap.read() blocks until the next frame, so the camera paces the loop
         while self.running:
             ret, frame = self.cap.read()
             if not ret:
                 continue
             
-            # Flip frame for mirror effect
-            frame = cv2.flip(frame, 1)
-            
             # Process frame
             processed_frame = self.process_frame(frame)
             
             # Update scoring
             self.update_focus_score()
             
-            # Send frame to UI thread (non-blocking)
-            try:
-                self.frame_queue.put(processed_frame, block=False)
-            except queue.Full:
-                pass  # Skip frame if queue is full
+            # Prepare preview for the UI here so the Tk thread does no image work
+            preview = cv2.resize(processed_frame, (320, 240), dst=self._preview)
+            
+            # Flip only the small preview for mirror effect
+            preview = cv2.flip(preview, 1, dst=self._mirrored)
+            
+            # Add overlay information after flipping so the text reads correctly
+            # (the UI labels already show the same status)
+            if self.debug_overlay:
+                self.add_frame_overlay(preview, 240)
             
-            time.sleep(1/30)  # ~30 FPS
+            preview_rgb = cv2.cvtColor(preview, cv2.COLOR_BGR2RGB, dst=self._preview_rgb).get()
+            
+            # Hand the freshest frame to the UI thread, scheduling at most one redraw
+            with self.frame_lock:
+                self.frame_deque.append(preview_rgb)
+                schedule = not self.frame_pending
+                self.frame_pending = True
+            if schedule:
+                try:
+                    self.root.after_idle(self.apply_frame)
+                except (RuntimeError, TclError):
+                    # Tk main loop not running yet or already shut down
+                    with self.frame_lock:
+                        self.frame_pending = False
     
     def process_frame(self, frame):
         """Process frame for face detection and posture analysis"""
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        faces = self.face_cascade.detectMultiScale(
-            gray, scaleFactor=1.1, minNeighbors=5, minSize=(50, 50)
-        )
+        height, width = frame.shape[:2]
+        
+        # Wrap as UMat so OpenCV can offload image ops via OpenCL (T-API).
+        # Detection runs on the unmirrored frame; only the preview is flipped.
+        frame = cv2.UMat(frame)
+        
+        # Skip all processing while the scene is still; previous results remain valid
+        if not self.motion_detected(frame):
+            self.draw_face(frame)
+            return frame
+        
+        # Run the detector every Nth frame, reuse the last face in between
+        self.frame_idx += 1
+        fresh_detection = False
+        self.detector_ran = self.frame_idx % self.detection_interval == 0 or self.last_face is None
+        if self.detector_ran:
+            # Detect on a downsampled image (detector cost scales with pixel count)
+            small_size = (int(width * self.detection_scale), int(height * self.detection_scale))
+            small = cv2.resize(frame, small_size, dst=self._small, interpolation=cv2.INTER_AREA)
+            
+            # The DNN runs on the CPU, so hand it a numpy array
+            self.detector.setInputSize(small_size)
+            _, faces = self.detector.detect(small.get())
+            
+            if faces is not None and len(faces) > 0:
+                # Get largest face, scaled back up to full frame coordinates
+                face = max(faces, key=lambda row: row[2] * row[3])
+                self.last_face = tuple(int(v / self.detection_scale) for v in face[:4])
+                # Right eye, left eye, nose tip, right and left mouth corners as (x, y) rows
+                self.last_landmarks = face[4:14].reshape(5, 2) / self.detection_scale
+                fresh_detection = True
+            else:
+                self.last_face = None
+                self.last_landmarks = None
         
         # Smooth detection using buffer
-        face_detected = len(faces) > 0
-        self.detection_buffer.append(face_detected)
-        if len(self.detection_buffer) > self.detection_smoothing:
-            self.detection_buffer.pop(0)
+        face_detected = self.last_face is not None
+        if len(self.detection_buffer) == self.detection_buffer.maxlen:
+            self.present_count -= self.detection_buffer[0]
+        self.detection_buffer.append(int(face_detected))
+        self.present_count += int(face_detected)
         
-        # Determine presence based on smoothed detection
-        self.is_present = sum(self.detection_buffer) > len(self.detection_buffer) // 2
+        # Determine presence based on smoothed detection (majority vote)
+        self.is_present = self.present_count * 2 > len(self.detection_buffer)
         
         if face_detected:
-            # Get largest face
-            face = max(faces, key=lambda rect: rect[2] * rect[3])
-            x, y, w, h = face
-            
-            # Draw face rectangle
-            color = (0, 255, 0) if self.is_present else (255, 255, 0)
-            cv2.rectangle(frame, (x, y), (x+w, y+h), color, 2)
+            self.draw_face(frame)
             
-            # Calibrate baseline if needed
-            if not self.calibration_complete:
-                self.calibrate_posture(x, y, w, h)
-            
-            # Analyze posture
-            if self.calibration_complete:
-                self.analyze_posture(x, y, w, h)
+            # Posture only changes when the detector produced new landmarks
+            if fresh_detection:
+                # Calibrate baseline if needed
+                if not self.calibration_complete:
+                    self.calibrate_posture(self.last_landmarks)
+                
+                # Analyze posture
+                if self.calibration_complete:
+                    self.analyze_posture(self.last_landmarks)
         else:
             # No face detected
             self.posture_multiplier = 1.0  # Neutral when away
         
-        # Add overlay information
-        self.add_frame_overlay(frame)
-        
         return frame
     
-    def calibrate_posture(self, x, y, w, h):
+    def motion_detected(self, frame):
+        """Cheap motion check on a tiny grayscale copy of the frame"""
+        tiny = cv2.resize(frame, (80, 60), interpolation=cv2.INTER_AREA)
+        tiny = cv2.cvtColor(tiny, cv2.COLOR_BGR2GRAY)
+        
+        # Skipping is only safe once the previous results are settled: the last processed
+        # frame ran the detector (no reused face) and the presence vote is full and
+        # unanimous. Keep processing while calibrating so a still user still gets a baseline.
+        settled = (self.detector_ran
+                   and len(self.detection_buffer) == self.detection_buffer.maxlen
+                   and self.present_count in (0, self.detection_buffer.maxlen)
+                   and (self.calibration_complete or self.last_face is None))
+        if (settled and self.prev_tiny is not None
+                and cv2.mean(cv2.absdiff(tiny, self.prev_tiny))[0] < self.motion_threshold):
+            return False
+        
+        # Compare against the last processed frame so slow drift still adds up
+        self.prev_tiny = tiny
+        return True
+    
+    def draw_face(self, frame):
+        """Draw the last detected face rectangle"""
+        if self.last_face is None:
+            return
+        x, y, w, h = self.last_face
+        color = (0, 255, 0) if self.is_present else (255, 255, 0)
+        cv2.rectangle(frame, (x, y), (x+w, y+h), color, 2)
+    
+    def posture_metrics(self, landmarks):
+        """Measure eye distance, head tilt and chin offset from face landmarks"""
+        right_eye, left_eye, nose = landmarks[0], landmarks[1], landmarks[2]
+        dx, dy = left_eye - right_eye
+        
+        # Eye distance grows as the user leans in towards the camera
+        eye_distance = float(np.linalg.norm(left_eye - right_eye))
+        # Slope of the eye line (abs(dx) keeps it valid for mirrored frames)
+        tilt = float(np.arctan2(dy, abs(dx)))
+        # Nose drop below the eye line, relative to eye distance, changes with chin tuck
+        chin_offset = float(nose[1] - (left_eye[1] + right_eye[1]) / 2) / eye_distance
+        
+        return eye_distance, tilt, chin_offset
+    
+    def calibrate_posture(self, landmarks):
         """Calibrate baseline posture measurements"""
-        face_size = w * h
-        face_center_y = y + h // 2
+        eye_distance, _, chin_offset = self.posture_metrics(landmarks)
         
-        if self.baseline_face_size is None:
-            self.baseline_face_size = face_size
-            self.baseline_face_center_y = face_center_y
+        if self.baseline_eye_distance is None:
+            self.baseline_eye_distance = eye_distance
+            self.baseline_chin_offset = chin_offset
             self.calibration_frames = 1
         else:
-            # Average over multiple frames for stability
-            self.baseline_face_size = (self.baseline_face_size * self.calibration_frames + face_size) / (self.calibration_frames + 1)
-            self.baseline_face_center_y = (self.baseline_face_center_y * self.calibration_frames + face_center_y) / (self.calibration_frames + 1)
+            # Incremental running mean over multiple detections for stability
             self.calibration_frames += 1
+            alpha = 1 / self.calibration_frames
+            self.baseline_eye_distance += alpha * (eye_distance - self.baseline_eye_distance)
+            self.baseline_chin_offset += alpha * (chin_offset - self.baseline_chin_offset)
         
-        if self.calibration_frames >= 30:  # Calibrate over 30 frames (~1 second)
+        if self.calibration_frames >= 30:  # Calibrate over 30 detections (~5 seconds)
             self.calibration_complete = True
     
-    def analyze_posture(self, x, y, w, h):
+    def analyze_posture(self, landmarks):
         """Analyze current posture and update multiplier"""
-        face_size = w * h
-        face_center_y = y + h // 2
-        
-        # Calculate deviations from baseline
-        size_ratio = face_size / self.baseline_face_size
-        y_deviation = abs(face_center_y - self.baseline_face_center_y) / self.baseline_face_center_y
+        eye_distance, tilt, chin_offset = self.posture_metrics(landmarks)
         
-        # Determine posture quality
-        posture_score = 1.0
+        # Calculate deviations from baseline (squared distance ratio ~ face area ratio)
+        size_ratio = (eye_distance / self.baseline_eye_distance) ** 2
+        chin_deviation = abs(chin_offset - self.baseline_chin_offset) / abs(self.baseline_chin_offset)
         
-        # Penalty for being too close (face too large)
-        if size_ratio > (1 + self.face_size_tolerance):
-            posture_score *= max(0.3, 1.0 - (size_ratio - 1.0))
-        
-        # Penalty for slouching (face position changed significantly)
-        if y_deviation > self.face_position_tolerance:
-            posture_score *= max(0.3, 1.0 - y_deviation)
-        
-        # Bonus for good posture
-        if size_ratio <= (1 + self.face_size_tolerance * 0.5) and y_deviation <= self.face_position_tolerance * 0.5:
-            posture_score = min(self.max_posture_multiplier, posture_score * 1.2)
-        
-        self.posture_multiplier = max(self.min_posture_multiplier, min(self.max_posture_multiplier, posture_score))
+        self.posture_multiplier = posture_score(
+            size_ratio, chin_deviation, abs(tilt),
+            self.face_size_tolerance, self.face_position_tolerance, self.head_tilt_tolerance,
+            self.min_posture_multiplier, self.max_posture_multiplier
+        )
     
-    def add_frame_overlay(self, frame):
+    def add_frame_overlay(self, frame, height):
         """Add informational overlay to frame"""
-        height, width = frame.shape[:2]
+        # Layout is designed for 480 px high frames
+        scale = height / 480
+        thickness = max(1, round(2 * scale))
         
         # Status indicator
         status_text = "PRESENT" if self.is_present else "AWAY"
         status_color = (0, 255, 0) if self.is_present else (0, 0, 255)
-        cv2.putText(frame, status_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, status_color, 2)
+        cv2.putText(frame, status_text, (int(10 * scale), int(30 * scale)), cv2.FONT_HERSHEY_SIMPLEX,
+                    1 * scale, status_color, thickness)
         
         # Posture indicator
         if self.calibration_complete:
@@ -324,29 +473,31 @@ class GazeFocus:
                 posture_text = "CHECK POSTURE"
                 posture_color = (0, 165, 255)
             
-            cv2.putText(frame, posture_text, (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.7, posture_color, 2)
+            cv2.putText(frame, posture_text, (int(10 * scale), int(70 * scale)), cv2.FONT_HERSHEY_SIMPLEX,
+                        0.7 * scale, posture_color, thickness)
         
         # Focus score
-        cv2.putText(frame, f"Score: {int(self.focus_score)}", (10, height - 30), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+        cv2.putText(frame, f"Score: {int(self.focus_score)}", (int(10 * scale), height - int(30 * scale)), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.8 * scale, (255, 255, 255), thickness)
     
     def update_focus_score(self):
         """Update focus score based on presence and posture"""
         if not self.session_active:
             return
         
-        current_time = time.time()
+        # Throttle updates; the score changes imperceptibly per camera frame
+        current_time = time.monotonic()
+        if current_time < self._next_score_update:
+            return
+        self._next_score_update = current_time + self.score_update_interval
+        
         time_delta = current_time - self.last_update_time
         self.last_update_time = current_time
         
-        if self.is_present:
-            # Earn points for being present, modified by posture
-            points_earned = self.presence_points_per_second * time_delta * self.posture_multiplier
-            self.focus_score = min(self.max_score, self.focus_score + points_earned)
-        else:
-            # Lose points when away
-            points_lost = self.score_decay_rate * time_delta
-            self.focus_score = max(0, self.focus_score - points_lost)
+        self.focus_score = updated_focus_score(
+            self.focus_score, time_delta, self.is_present, self.posture_multiplier,
+            self.presence_points_per_second, self.score_decay_rate, self.max_score
+        )
     
     def toggle_session(self):
         """Toggle session start/pause"""
@@ -358,14 +509,14 @@ class GazeFocus:
     def start_session(self):
         """Start a new session"""
         self.session_active = True
-        self.session_start_time = time.time()
-        self.last_update_time = time.time()
+        self.session_start_time = time.monotonic()
+        self.last_update_time = time.monotonic()
         self.start_button.configure(text="Pause Session")
     
     def pause_session(self):
         """Pause current session"""
         if self.session_active and self.session_start_time:
-            self.total_session_time += time.time() - self.session_start_time
+            self.total_session_time += time.monotonic() - self.session_start_time
         self.session_active = False
         self.session_start_time = None
         self.start_button.configure(text="Resume Session")
@@ -375,67 +526,75 @@ class GazeFocus:
         self.pause_session()
         self.focus_score = 0.0
         self.total_session_time = 0
-        self.baseline_face_size = None
-        self.baseline_face_center_y = None
+        self.baseline_eye_distance = None
+        self.baseline_chin_offset = None
         self.calibration_frames = 0
         self.calibration_complete = False
         self.posture_multiplier = 1.0
         self.start_button.configure(text="Start Session", fg_color="#1f538d", hover_color="#14375e")
     
     def update_ui(self):
-        """Update UI elements (runs in main thread)"""
+        """Update non-video UI elements (runs in main thread)"""
         if not self.running:
             return
         
-        # Update video feed
-        try:
-            frame = self.frame_queue.get_nowait()
-            # Convert frame to PhotoImage
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            frame_resized = cv2.resize(frame_rgb, (320, 240))
-            image = Image.fromarray(frame_resized)
-            photo = ImageTk.PhotoImage(image)
-            self.video_label.configure(image=photo, text="")
-            self.video_label.image = photo  # Keep a reference
-        except queue.Empty:
-            pass
-        
         # Update focus score
         score_percentage = self.focus_score / self.max_score
-        self.progress_bar.set(score_percentage)
-        self.score_label.configure(text=f"{int(self.focus_score)}%")
+        if score_percentage != self._last_progress:
+            self.progress_bar.set(score_percentage)
+            self._last_progress = score_percentage
+        self.configure_if_changed(self.score_label, text=f"{int(self.focus_score)}%")
         
         # Update status indicators
         if self.session_active:
             if self.is_present:
-                self.status_label.configure(text="🟢 Focused", text_color="#51cf66")
+                self.configure_if_changed(self.status_label, text="🟢 Focused", text_color="#51cf66")
             else:
-                self.status_label.configure(text="🟡 Away", text_color="#ffd93d")
+                self.configure_if_changed(self.status_label, text="🟡 Away", text_color="#ffd93d")
         else:
-            self.status_label.configure(text="🔴 Paused", text_color="#ff6b6b")
+            self.configure_if_changed(self.status_label, text="🔴 Paused", text_color="#ff6b6b")
         
         # Update posture status
         if not self.calibration_complete:
-            self.posture_label.configure(text="📏 Calibrating...", text_color="#ffd93d")
+            self.configure_if_changed(self.posture_label, text="📏 Calibrating...", text_color="#ffd93d")
         elif self.posture_multiplier > 1.2:
-            self.posture_label.configure(text="✅ Excellent Posture", text_color="#51cf66")
+            self.configure_if_changed(self.posture_label, text="✅ Excellent Posture", text_color="#51cf66")
         elif self.posture_multiplier > 0.8:
-            self.posture_label.configure(text="✅ Good Posture", text_color="#51cf66")
+            self.configure_if_changed(self.posture_label, text="✅ Good Posture", text_color="#51cf66")
         else:
-            self.posture_label.configure(text="⚠️ Check Posture", text_color="#ff8787")
+            self.configure_if_changed(self.posture_label, text="⚠️ Check Posture", text_color="#ff8787")
         
         # Update session time
         current_session_time = self.total_session_time
         if self.session_active and self.session_start_time:
-            current_session_time += time.time() - self.session_start_time
+            current_session_time += time.monotonic() - self.session_start_time
         
         hours = int(current_session_time // 3600)
         minutes = int((current_session_time % 3600) // 60)
         seconds = int(current_session_time % 60)
-        self.session_label.configure(text=f"🕒 {hours:02d}:{minutes:02d}:{seconds:02d}")
+        self.configure_if_changed(self.session_label, text=f"🕒 {hours:02d}:{minutes:02d}:{seconds:02d}")
         
         # Schedule next update
-        self.root.after(100, self.update_ui)  # Update every 100ms
+        self.root.after(250, self.update_ui)  # Update every 250ms
+    
+    def apply_frame(self):
+        """Show the latest preview frame (scheduled from the OpenCV thread)"""
+        with self.frame_lock:
+            frame = self.frame_deque.pop() if self.frame_deque else None
+            self.frame_pending = False
+        
+        if frame is None or not self.running:
+            return
+        
+        # Frame arrives already resized and in RGB
+        self.video_photo.paste(Image.fromarray(frame))
+        self.configure_if_changed(self.video_label, image=self.video_photo, text="")
+    
+    def configure_if_changed(self, widget, **kwargs):
+        """Configure widget only when the options differ from the last applied ones"""
+        if self._widget_state.get(widget) != kwargs:
+            widget.configure(**kwargs)
+            self._widget_state[widget] = kwargs
     
     def quit_app(self):
         """Clean shutdown"""
@@ -472,4 +631,5 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Error: {e}")
         print("Make sure you have a webcam connected and the required packages installed:")
-        print("pip install opencv-python customtkinter pillow numpy")
\ No newline at end of file
+        print("pip install opencv-python customtkinter pillow numpy")
+        print("and that the YuNet model is available at models/face_detection_yunet_2023mar.onnx")
\ No newline at end of file